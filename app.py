@@ -9,6 +9,7 @@ from config import config
 from database import DatabaseManager, ListingRepository
 from service import ApartmentSearchRunner
 from notifier import TelegramBotService
+from utils import run_event_loop
 
 # Configure logging
 logging.basicConfig(
@@ -28,24 +29,27 @@ class ApartmentSearchApp:
         self.search_runner = ApartmentSearchRunner()
         self.telegram_bot = None
         self.is_running = False
+        self._stop_event = asyncio.Event()
+        self._stopped = False
         
         # Disable Telegram bot in Coolify environment
         # if config.TELEGRAM_BOT_TOKEN and config.TELEGRAM_CHAT_IDS:
         #     self.telegram_bot = TelegramBotService(config.TELEGRAM_BOT_TOKEN)
     
     async def start(self) -> None:
-        """Start all application services."""
+        """
+        Start all application services and wait until shutdown is requested.
+        Cleanup is left to the caller, which runs stop() exactly once.
+        """
         logger.info("Starting Apartment Search Application")
         
         # Setup signal handlers for graceful shutdown
         self._setup_signal_handlers()
         
         try:
-            # Initialize but don't actively use the Telegram bot
-            # Just have it available for sending notifications
+            # Start the Telegram bot; it long-polls for commands in the background
             if self.telegram_bot:
                 try:
-                    # Simple initialization only, no polling
                     await self.telegram_bot.start()
                     logger.info("Telegram notification service initialized")
                 except Exception as e:
@@ -61,28 +65,22 @@ class ApartmentSearchApp:
             self.is_running = True
             logger.info("Application started successfully")
             
-            # Keep the application running
-            while self.is_running:
-                # Check for Telegram commands if bot is available
-                if self.telegram_bot:
-                    try:
-                        await asyncio.wait_for(
-                            self.telegram_bot.check_for_commands(),
-                            timeout=5.0
-                        )
-                    except asyncio.TimeoutError:
-                        logger.warning("Telegram command check timed out, continuing execution")
-                
-                await asyncio.sleep(5)
+            # Keep the application running until stop() is requested
+            await self._stop_event.wait()
+            logger.info("Shutdown requested")
                 
         except Exception as e:
             logger.error(f"Error starting application: {e}")
-            await self.stop()
     
     async def stop(self) -> None:
-        """Stop all application services."""
+        """Stop all application services; repeated calls are ignored."""
+        if self._stopped:
+            return
+        self._stopped = True
+        
         logger.info("Stopping application...")
         self.is_running = False
+        self._stop_event.set()
         
         # Stop services
         await self.search_runner.stop()
@@ -98,16 +96,10 @@ class ApartmentSearchApp:
     
     def _setup_signal_handlers(self) -> None:
         """Setup handlers for system signals."""
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            asyncio.get_event_loop().add_signal_handler(
-                sig,
-                lambda s=sig: asyncio.create_task(self._handle_signal(s))
-            )
-    
-    async def _handle_signal(self, signal_received: int) -> None:
-        """Handle system signals for graceful shutdown."""
-        logger.info(f"Received exit signal {signal_received.name}...")
-        await self.stop()
+            # Wake start() directly; it returns and the caller runs stop()
+            loop.add_signal_handler(sig, self._stop_event.set)
 
 async def main() -> None:
     """Application entry point."""
@@ -123,7 +115,7 @@ if __name__ == "__main__":
     try:
         # Make it visible that app is starting
         print("\n=== Wohnungssuche Application Starting ===\n")
-        asyncio.run(main())
+        run_event_loop(main())
     except Exception as e:
         logger.critical(f"Unhandled exception: {e}", exc_info=True)
         sys.exit(1)
@@ -1,12 +1,10 @@
 """Configuration module for the apartment search application."""
 import os
-from typing import Dict, List, Union, Any
+from functools import cached_property
+from typing import Dict, List, Optional, Union, Any
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 class Config:
     """Application-wide configuration with sensible defaults."""
     
@@ -30,8 +28,8 @@ class Config:
         }
     }
     
-    # Search URLs (generated from config)
-    @property
+    # Search URLs (generated from config, computed once on first access)
+    @cached_property
     def SEARCH_URLS(self) -> List[str]:
         """Generate search URLs based on configuration."""
         return [
@@ -39,25 +37,35 @@ class Config:
             for district, location_id in self.SEARCH_CONFIG['districts'].items()
         ]
     
-    # Notification
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
+    # Notification (TELEGRAM_BOT_TOKEN is read from the environment on initialization)
     
-    @property
+    @cached_property
     def TELEGRAM_CHAT_IDS(self) -> List[str]:
         """Get list of Telegram chat IDs from environment variable."""
         chat_ids = os.getenv('TELEGRAM_CHAT_IDS', '')
         return [id.strip() for id in chat_ids.split(',') if id.strip()]
     
-    # Database
-    DATABASE_URL = os.getenv('DATABASE_URL', '')
+    # Database (DATABASE_URL is read from the environment on initialization)
     
     # Timing
-    CHECK_INTERVAL = 100  # 5 minutes
+    CHECK_INTERVAL = 100  # seconds, initial wait between search cycles
+    CHECK_INTERVAL_MIN = 30  # seconds, shortest wait while new listings keep appearing
+    CHECK_INTERVAL_MAX = 600  # seconds, longest wait during quiet periods
     PAGE_LOAD_TIMEOUT = 10  # seconds
+    
+    # Politeness towards the listing site
+    MAX_CONCURRENCY = 4  # districts scanned at the same time
+    DETAIL_CONCURRENCY = 8  # listing detail pages fetched at the same time
+    MAX_RPS = 2  # requests per second to the listing site
     ELEMENT_TIMEOUT = 10  # seconds for element waits (decreased from 15)
     
     # Browser settings
     HEADLESS_MODE = True  # Set to False to see the browser window
+    USER_AGENT = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+    )  # Sent with plain HTTP requests to the listing site
+    CONSENT_COOKIE_FILE = Path.home() / '.cache' / 'wohnungssuche' / 'consent.json'  # Accepted GDPR consent, reused across runs
     
     # Contact message
     PREDEFINED_TEXT = """Guten Tag,
@@ -75,7 +83,12 @@ Mit freundlichen Grüßen
 R. Cinar"""
     
     def __init__(self):
-        """Validate configuration on initialization."""
+        """Load and validate configuration on initialization."""
+        load_dotenv()
+        
+        self.TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
+        self.DATABASE_URL = os.getenv('DATABASE_URL', '')
+        
         if not self.DATABASE_URL:
             raise ValueError("DATABASE_URL not found in environment variables")
         
@@ -83,5 +96,20 @@ R. Cinar"""
         if not self.TELEGRAM_BOT_TOKEN or not self.TELEGRAM_CHAT_IDS:
             print("Warning: Telegram not fully configured. Notifications will be disabled.")
 
-# Create a global config instance
-config = Config()
+_config: Optional[Config] = None
+
+def get_config() -> Config:
+    """Return the global configuration, loading .env on first use."""
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
+
+class _LazyConfig:
+    """Stand-in for the global config that creates it on first attribute access."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+# Global config instance; importing this module does not read .env yet
+config = _LazyConfig()
@@ -1,8 +1,7 @@
--- Drop existing tables if they exist
-DROP TABLE IF EXISTS listings CASCADE;
+-- Idempotent: safe to run on every start without touching existing data
 
 -- Create listings table
-CREATE TABLE listings (
+CREATE TABLE IF NOT EXISTS listings (
     id SERIAL PRIMARY KEY,
     listing_id VARCHAR(255) UNIQUE NOT NULL,
     title TEXT,
@@ -19,6 +18,6 @@ CREATE TABLE listings (
 
 
 -- Create indexes
-CREATE INDEX idx_listing_id ON listings(listing_id);
-CREATE INDEX idx_status ON listings(status);
-CREATE INDEX idx_created_at ON listings(created_at);
\ No newline at end of file
+-- listing_id lookups and ON CONFLICT (listing_id) use the index backing its UNIQUE constraint
+CREATE INDEX IF NOT EXISTS idx_status ON listings(status);
+CREATE INDEX IF NOT EXISTS idx_created_at ON listings(created_at);
@@ -1,21 +1,37 @@
 """Database module for the apartment search application."""
-import psycopg2
-from psycopg2 import pool
-from datetime import datetime
-from typing import Dict, List, Optional, Union, Any, Tuple
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Union, Any, Tuple
 from contextlib import contextmanager
 from config import config
 
 class DatabaseManager:
-    """Database manager with connection pooling."""
+    """Database manager with thread-safe connection pooling."""
     
-    def __init__(self, min_connections: int = 1, max_connections: int = 5):
-        """Initialize the database manager with a connection pool."""
-        self._pool = psycopg2.pool.SimpleConnectionPool(
+    def __init__(self, min_connections: int = 4, max_connections: int = 16):
+        """
+        Initialize the database manager with a connection pool.
+        The pool is thread-safe so repository calls can run in executor threads.
+        min_connections should cover ListingRepository.DB_WORKERS; connections
+        above it are closed when returned, which causes connect/close churn.
+        """
+        # Imported here so that importing this module stays cheap
+        import psycopg2.pool
+        
+        self._pool = psycopg2.pool.ThreadedConnectionPool(
             min_connections,
             max_connections,
             config.DATABASE_URL
         )
+        
+        # Names of the statements prepared on each pooled connection. Keyed by
+        # the connection object itself, so entries vanish with discarded
+        # connections and a new connection never inherits another's statements
+        self._prepared: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+        self._prepared_lock = threading.Lock()
     
     @contextmanager
     def get_connection(self):
@@ -27,10 +43,13 @@ class DatabaseManager:
             self._pool.putconn(conn)
     
     @contextmanager
-    def get_cursor(self):
-        """Get a connection and cursor from the pool and return them when done."""
+    def get_cursor(self, cursor_factory=None):
+        """
+        Get a connection and cursor from the pool and return them when done.
+        Pass a psycopg2 cursor_factory, e.g. RealDictCursor, to change the row type.
+        """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
+            cursor = conn.cursor(cursor_factory=cursor_factory)
             try:
                 yield cursor
                 conn.commit()
@@ -40,6 +59,22 @@ class DatabaseManager:
             finally:
                 cursor.close()
     
+    def prepare(self, cursor, name: str, statement: str, param_types: str = '') -> None:
+        """
+        Prepare a named statement on the cursor's connection unless already done.
+        Prepared statements live for the whole session, so PostgreSQL parses
+        and plans them once per pooled connection instead of once per call.
+        """
+        conn = cursor.connection
+        with self._prepared_lock:
+            if name in self._prepared.get(conn, ()):
+                return
+        
+        cursor.execute(f"PREPARE {name} {param_types} AS {statement}")
+        
+        with self._prepared_lock:
+            self._prepared.setdefault(conn, set()).add(name)
+    
     def close(self):
         """Close all connections in the pool."""
         if self._pool:
@@ -49,57 +84,211 @@ class DatabaseManager:
 class ListingRepository:
     """Repository for apartment listing data operations."""
     
+    # Upper bound for the in-memory cache of listing IDs known to exist
+    SEEN_CACHE_SIZE = 10_000
+    
+    # Insertable columns, in the order used by every insert statement
+    _COLUMNS = (
+        'listing_id', 'title', 'price', 'size', 'rooms',
+        'location', 'url', 'status', 'description'
+    )
+    _COLUMN_LIST = ', '.join(_COLUMNS)
+    
+    _INSERT_STMT = 'save_listing_stmt'
+    _INSERT_SQL = f"""
+        INSERT INTO listings ({_COLUMN_LIST})
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        ON CONFLICT (listing_id) DO NOTHING
+        RETURNING id
+    """
+    _INSERT_PARAM_TYPES = '(text, text, numeric, numeric, integer, text, text, text, text)'
+    _EXECUTE_INSERT_SQL = f"EXECUTE {_INSERT_STMT} ({', '.join(['%s'] * len(_COLUMNS))})"
+    
+    _EXISTING_STMT = 'existing_ids_stmt'
+    _EXISTING_SQL = "SELECT listing_id FROM listings WHERE listing_id = ANY($1)"
+    _EXECUTE_EXISTING_SQL = f"EXECUTE {_EXISTING_STMT} (%s)"
+    
+    _INSERT_MANY_SQL = f"""
+        INSERT INTO listings ({_COLUMN_LIST})
+        VALUES %s
+        ON CONFLICT (listing_id) DO NOTHING
+        RETURNING listing_id
+    """
+    
+    # Threads available to the async wrappers; kept below the pool's connection limit
+    DB_WORKERS = 4
+    
     def __init__(self, db_manager: DatabaseManager):
         """Initialize with a database manager."""
         self.db_manager = db_manager
+        self._db_executor = ThreadPoolExecutor(max_workers=self.DB_WORKERS, thread_name_prefix="db")
+        # Listings are never deleted, so a positive existence check stays valid
+        self._seen_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._seen_lock = threading.Lock()
+    
+    def _remember(self, listing_id: str) -> None:
+        """Record a listing ID as existing, evicting the least recently used."""
+        with self._seen_lock:
+            self._seen_ids[listing_id] = None
+            self._seen_ids.move_to_end(listing_id)
+            if len(self._seen_ids) > self.SEEN_CACHE_SIZE:
+                self._seen_ids.popitem(last=False)
+    
+    @staticmethod
+    def _row(listing_data: Dict[str, Any]) -> Tuple:
+        """Build the insert parameters for a listing in column order."""
+        return (
+            listing_data['listing_id'], listing_data.get('title'), listing_data.get('price'),
+            listing_data.get('size'), listing_data.get('rooms'), listing_data.get('location'),
+            listing_data.get('url'), listing_data.get('status', 'new'), listing_data.get('description')
+        )
+    
+    async def _run(self, func, *args):
+        """Run a blocking repository method on the database executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, func, *args)
+    
+    def close(self) -> None:
+        """Wait for pending database work and stop the executor threads."""
+        self._db_executor.shutdown(wait=True)
+    
+    def _is_known(self, listing_id: str) -> bool:
+        """Check the seen cache, refreshing the entry on a hit."""
+        with self._seen_lock:
+            if listing_id in self._seen_ids:
+                self._seen_ids.move_to_end(listing_id)
+                return True
+            return False
     
-    def save_listing(self, listing_data: Dict[str, Any]) -> int:
+    def save_listing(self, listing_data: Dict[str, Any]) -> Optional[int]:
         """
         Save a new listing to the database.
-        Returns the ID of the inserted listing.
+        Returns the ID of the inserted listing, or None if it already existed.
         """
-        status = listing_data.get('status', 'new')
-        
         with self.db_manager.get_cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO listings (
-                    listing_id, title, price, size, rooms, 
-                    location, url, status, description
-                ) VALUES (
-                    %(listing_id)s, %(title)s, %(price)s, %(size)s, %(rooms)s,
-                    %(location)s, %(url)s, %(status)s, %(description)s
-                ) RETURNING id
-            """, {**listing_data, 'status': status})
+            self.db_manager.prepare(
+                cursor, self._INSERT_STMT, self._INSERT_SQL, self._INSERT_PARAM_TYPES
+            )
+            cursor.execute(self._EXECUTE_INSERT_SQL, self._row(listing_data))
             
-            return cursor.fetchone()[0]
+            row = cursor.fetchone()
+        
+        self._remember(listing_data['listing_id'])
+        return row[0] if row else None
+    
+    def save_listings(self, listings: List[Dict[str, Any]]) -> List[str]:
+        """
+        Save several new listings in a single statement and transaction.
+        Returns the listing IDs of the inserted rows; existing ones are skipped.
+        """
+        if not listings:
+            return []
+        
+        from psycopg2.extras import execute_values
+        
+        rows = [self._row(d) for d in listings]
+        
+        with self.db_manager.get_cursor() as cursor:
+            result = execute_values(cursor, self._INSERT_MANY_SQL, rows, page_size=100, fetch=True)
+        
+        for d in listings:
+            self._remember(d['listing_id'])
+        return [row[0] for row in result]
     
     def listing_exists(self, listing_id: str) -> bool:
-        """Check if a listing already exists in the database."""
+        """Check if a listing already exists, consulting the seen cache first."""
+        if self._is_known(listing_id):
+            return True
+        
         with self.db_manager.get_cursor() as cursor:
             cursor.execute(
-                "SELECT EXISTS(SELECT 1 FROM listings WHERE listing_id = %s)",
+                "SELECT 1 FROM listings WHERE listing_id = %s LIMIT 1",
                 (listing_id,)
             )
-            return cursor.fetchone()[0]
+            exists = cursor.fetchone() is not None
+        
+        if exists:
+            self._remember(listing_id)
+        return exists
+    
+    def existing_ids(self, listing_ids: List[str]) -> Set[str]:
+        """
+        Return which of the given listing IDs already exist.
+        IDs missing from the seen cache are looked up in a single query.
+        """
+        found = {listing_id for listing_id in listing_ids if self._is_known(listing_id)}
+        missing = [listing_id for listing_id in listing_ids if listing_id not in found]
+        if not missing:
+            return found
+        
+        with self.db_manager.get_cursor() as cursor:
+            self.db_manager.prepare(cursor, self._EXISTING_STMT, self._EXISTING_SQL, '(text[])')
+            cursor.execute(self._EXECUTE_EXISTING_SQL, (missing,))
+            rows = cursor.fetchall()
+        
+        for (listing_id,) in rows:
+            self._remember(listing_id)
+            found.add(listing_id)
+        return found
     
     def mark_listing_processed(self, listing_id: str) -> None:
         """Mark a listing as processed."""
         with self.db_manager.get_cursor() as cursor:
             cursor.execute(
-                "UPDATE listings SET processed_at = %s WHERE listing_id = %s",
-                (datetime.now(), listing_id)
+                "UPDATE listings SET processed_at = NOW() WHERE listing_id = %s",
+                (listing_id,)
             )
     
     def mark_listing_error(self, listing_id: str, error_message: str) -> None:
         """Mark a listing as having an error."""
         with self.db_manager.get_cursor() as cursor:
             cursor.execute(
-                "UPDATE listings SET status = 'error', processed_at = %s, description = %s WHERE listing_id = %s",
-                (datetime.now(), f"Error: {error_message}", listing_id)
+                "UPDATE listings SET status = 'error', processed_at = NOW(), description = %s WHERE listing_id = %s",
+                (f"Error: {error_message}", listing_id)
             )
     
+    # Async variants for use from the event loop; psycopg2 calls run in executor threads
+    
+    async def asave_listing(self, listing_data: Dict[str, Any]) -> Optional[int]:
+        """Async variant of save_listing."""
+        return await self._run(self.save_listing, listing_data)
+    
+    async def asave_listings(self, listings: List[Dict[str, Any]]) -> List[str]:
+        """Async variant of save_listings."""
+        return await self._run(self.save_listings, listings)
+    
+    async def alisting_exists(self, listing_id: str) -> bool:
+        """Async variant of listing_exists that skips the executor on a cache hit."""
+        if self._is_known(listing_id):
+            return True
+        return await self._run(self.listing_exists, listing_id)
+    
+    async def aexisting_ids(self, listing_ids: List[str]) -> Set[str]:
+        """Async variant of existing_ids."""
+        return await self._run(self.existing_ids, listing_ids)
+    
+    async def amark_listing_processed(self, listing_id: str) -> None:
+        """Async variant of mark_listing_processed."""
+        await self._run(self.mark_listing_processed, listing_id)
+    
+    async def amark_listing_error(self, listing_id: str, error_message: str) -> None:
+        """Async variant of mark_listing_error."""
+        await self._run(self.mark_listing_error, listing_id, error_message)
+    
     def get_listings(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Get listings, optionally filtered by status."""
+        return list(self.get_listings_iter(status=status, limit=limit))
+    
+    def get_listings_iter(self, status: Optional[str] = None, batch: int = 500,
+                          limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream listings, optionally filtered by status, newest first.
+        Rows come from a server-side cursor in batches of `batch`, so memory
+        stays bounded regardless of the result size. The pooled connection
+        is held until the iterator is exhausted or closed.
+        """
+        from psycopg2.extras import RealDictCursor
+        
         query = "SELECT * FROM listings"
         params = []
         
@@ -107,10 +296,20 @@ class ListingRepository:
             query += " WHERE status = %s"
             params.append(status)
         
-        query += " ORDER BY created_at DESC LIMIT %s"
-        params.append(limit)
+        query += " ORDER BY created_at DESC"
         
-        with self.db_manager.get_cursor() as cursor:
-            cursor.execute(query, params)
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
\ No newline at end of file
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        
+        with self.db_manager.get_connection() as conn:
+            # RealDictCursor builds the row dicts inside psycopg2
+            cursor = conn.cursor(name='listings_iter', cursor_factory=RealDictCursor)
+            cursor.itersize = batch
+            try:
+                cursor.execute(query, params)
+                yield from cursor
+            finally:
+                cursor.close()
+                # End the read transaction the named cursor lived in
+                conn.rollback()
@@ -3,10 +3,10 @@
 Main entry point for the apartment search application.
 This file provides a simple wrapper to start the application.
 """
-import asyncio
 import logging
 import sys
 from app import ApartmentSearchApp
+from utils import run_event_loop
 
 # Configure root logger
 logging.basicConfig(
@@ -37,7 +37,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\nApplication terminated by user.")
     except Exception as e:
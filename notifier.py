@@ -1,39 +1,76 @@
 """Notification module for apartment search results."""
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Callable
-import requests
-from telegram import Bot
-from telegram.ext import Application, CommandHandler, CallbackContext
-from telegram.error import TelegramError
+from contextlib import suppress
+from typing import Dict, Any, Optional, List, Callable, TYPE_CHECKING
+
+import aiohttp
 
 from config import config
+from utils import AsyncRateLimiter
+
+# telegram is a heavy import that nothing else needs; it is loaded on first use
+if TYPE_CHECKING:
+    from telegram import Bot
 
 logger = logging.getLogger(__name__)
 
+# Bot instances shared by all services using the same token
+_BOT_CACHE: Dict[str, "Bot"] = {}
+
+def _get_bot(bot_token: str) -> "Bot":
+    """Return the shared Bot instance for a token, creating it on first use."""
+    bot = _BOT_CACHE.get(bot_token)
+    if bot is None:
+        from telegram import Bot
+        
+        bot = _BOT_CACHE[bot_token] = Bot(bot_token)
+    return bot
+
+def _create_http_session() -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session for direct Telegram API calls."""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=10),
+        connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+    )
+
 class NotificationService:
     """Base notification service interface."""
     
     async def send_notification(self, message: str) -> bool:
         """Send a notification with the given message."""
         raise NotImplementedError("Subclasses must implement send_notification")
+    
+    async def close(self) -> None:
+        """Release any resources held by the service."""
 
 class TelegramNotifier(NotificationService):
     """Telegram-based notification service."""
     
+    # Stay below Telegram's limit of about 30 messages per second per bot
+    MAX_SENDS_PER_SECOND = 25
+    
     def __init__(self, bot_token: str, chat_ids: List[str]):
         """Initialize with the Telegram bot token and chat IDs."""
         self.bot_token = bot_token
         self.chat_ids = chat_ids
         self._bot = None
         self.use_fallback = False
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._send_limit = AsyncRateLimiter(self.MAX_SENDS_PER_SECOND, 1.0)
+    
+    async def close(self) -> None:
+        """Close the fallback HTTP session."""
+        if self._http:
+            await self._http.close()
+            self._http = None
     
     @property
-    def bot(self) -> Optional[Bot]:
+    def bot(self) -> Optional["Bot"]:
         """Lazy-initialize the bot instance."""
         if self._bot is None and self.bot_token and not self.use_fallback:
             try:
-                self._bot = Bot(self.bot_token)
+                self._bot = _get_bot(self.bot_token)
                 return self._bot
             except Exception as e:
                 logger.error(f"Failed to initialize Telegram bot: {e}")
@@ -42,16 +79,33 @@ class TelegramNotifier(NotificationService):
         return self._bot
     
     async def send_notification(self, message: str) -> bool:
-        """Send a notification via Telegram to all configured chat IDs."""
+        """Send a notification via Telegram to all configured chat IDs concurrently."""
         if self.use_fallback or not self.bot_token or not self.chat_ids:
-            return self._send_notification_fallback(message)
+            return await self._send_notification_fallback(message)
             
         if not self.bot:
             logger.warning("Telegram bot not initialized, using fallback method")
-            return self._send_notification_fallback(message)
+            return await self._send_notification_fallback(message)
+        
+        results = await asyncio.gather(
+            *(self._send_to_chat(message, chat_id) for chat_id in self.chat_ids),
+            return_exceptions=True
+        )
+        return self._all_sent(results)
+    
+    @staticmethod
+    def _all_sent(results: List[Any]) -> bool:
+        """Tell whether every per-chat send succeeded, logging unexpected errors."""
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Unexpected error sending Telegram message: {result}")
+        return all(result is True for result in results)
+    
+    async def _send_to_chat(self, message: str, chat_id: str) -> bool:
+        """Send a notification to a single chat, falling back to direct HTTP on error."""
+        from telegram.error import TelegramError
         
-        success = True
-        for chat_id in self.chat_ids:
+        async with self._send_limit:
             try:
                 await self.bot.send_message(
                     chat_id=chat_id,
@@ -59,42 +113,43 @@ class TelegramNotifier(NotificationService):
                     parse_mode="HTML"
                 )
                 logger.info(f"Notification sent successfully to chat {chat_id} via async API")
+                return True
             except TelegramError as e:
                 logger.error(f"Error sending Telegram message to chat {chat_id} via async API: {e}")
-                # Try fallback for this specific chat_id
-                if not self._send_notification_fallback_to_chat(message, chat_id):
-                    success = False
         
-        return success
+        # Try fallback for this specific chat_id
+        return await self._send_notification_fallback_to_chat(message, chat_id)
     
-    def _send_notification_fallback(self, message: str) -> bool:
-        """Send a notification using standard HTTP requests as fallback to all chats."""
+    async def _send_notification_fallback(self, message: str) -> bool:
+        """Send a notification using direct HTTP requests as fallback to all chats."""
         if not self.bot_token or not self.chat_ids:
             logger.warning("Telegram configuration missing, check .env file")
             return False
-            
-        success = True
-        for chat_id in self.chat_ids:
-            if not self._send_notification_fallback_to_chat(message, chat_id):
-                success = False
-        return success
+        
+        results = await asyncio.gather(
+            *(self._send_notification_fallback_to_chat(message, chat_id) for chat_id in self.chat_ids),
+            return_exceptions=True
+        )
+        return self._all_sent(results)
 
-    def _send_notification_fallback_to_chat(self, message: str, chat_id: str) -> bool:
-        """Send a notification to a specific chat using standard HTTP requests."""
+    async def _send_notification_fallback_to_chat(self, message: str, chat_id: str) -> bool:
+        """Send a notification to a specific chat using direct HTTP requests."""
+        if self._http is None or self._http.closed:
+            self._http = _create_http_session()
+        
         try:
-            response = requests.post(
+            async with self._send_limit, self._http.post(
                 f"https://api.telegram.org/bot{self.bot_token}/sendMessage",
                 json={
                     "chat_id": chat_id,
                     "text": message,
                     "parse_mode": "HTML"
-                },
-                timeout=10
-            )
-            response.raise_for_status()
+                }
+            ) as response:
+                response.raise_for_status()
             logger.info(f"Notification sent successfully to chat {chat_id} via fallback HTTP API")
             return True
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error sending Telegram message to chat {chat_id} via HTTP API: {e}")
             return False
     
@@ -124,13 +179,27 @@ class TelegramBotService:
     This avoids dependency on the polling mechanism that's causing issues.
     """
     
+    # Seconds a getUpdates request may block server-side waiting for updates
+    POLL_TIMEOUT = 25
+    MAX_BACKOFF = 30
+    
     def __init__(self, bot_token: str):
         """Initialize with the Telegram bot token."""
         self.bot_token = bot_token
         self.bot = None
         self.running = False
-        self.update_task = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._poll_task: Optional[asyncio.Task] = None
         self.last_update_id = 0
+        
+        # One queue and worker per chat: chats proceed independently,
+        # while updates within a chat are still handled in order
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        self._chat_workers: Dict[int, asyncio.Task] = {}
+        
+        # The fallback always sends the same text, so build its request once
+        self._send_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        self._text_payload = {"text": config.PREDEFINED_TEXT, "parse_mode": "HTML"}
     
     async def start(self) -> None:
         """Start the Telegram bot service."""
@@ -139,45 +208,94 @@ class TelegramBotService:
             return
         
         try:
-            # Simply create the bot instance directly
-            self.bot = Bot(self.bot_token)
+            self.bot = _get_bot(self.bot_token)
             logger.info("Successfully created Telegram bot instance")
             
-            # Don't start a background polling task
-            # Just mark as running for the manual API functionality
+            # Reused by every fallback send instead of a new connection per message
+            self._http = _create_http_session()
+            
             self.running = True
-            logger.info("Telegram bot service started in manual API mode")
+            self._poll_task = asyncio.create_task(self._poll_loop())
+            logger.info("Telegram bot service started with long polling")
         except Exception as e:
             logger.error(f"Failed to start Telegram bot: {e}")
     
     async def stop(self) -> None:
         """Stop the Telegram bot service."""
         self.running = False
+        
+        if self._poll_task:
+            self._poll_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._poll_task
+            self._poll_task = None
+        
+        for worker in self._chat_workers.values():
+            worker.cancel()
+        for worker in self._chat_workers.values():
+            with suppress(asyncio.CancelledError):
+                await worker
+        self._chat_workers.clear()
+        self._chat_queues.clear()
+        
+        if self._http:
+            await self._http.close()
+            self._http = None
+        
         logger.info("Telegram bot service stopped")
     
-    async def check_for_commands(self) -> None:
+    async def _poll_loop(self) -> None:
         """
-        Manual method to check for and process commands.
-        This can be called periodically from elsewhere in the application
-        if command handling is needed.
+        Long-poll Telegram for updates and dispatch commands.
+        Each getUpdates call blocks until updates arrive, so requests are
+        issued back-to-back without any extra sleep.
         """
-        if not self.bot or not self.running:
-            return
-            
-        try:
-            updates = await self.bot.get_updates(
-                offset=self.last_update_id + 1,
-                timeout=5  # Reduced timeout
-            )
-            
-            for update in updates:
-                if update.update_id > self.last_update_id:
-                    self.last_update_id = update.update_id
+        failures = 0
+        
+        while self.running:
+            try:
+                updates = await self.bot.get_updates(
+                    offset=self.last_update_id + 1,
+                    timeout=self.POLL_TIMEOUT,
+                    allowed_updates=['message']
+                )
                 
-                if update.message and update.message.text == '/text':
-                    await self._handle_text_command(update.message)
-        except Exception as e:
-            logger.error(f"Error checking Telegram updates: {e}")
+                for update in updates:
+                    if update.update_id > self.last_update_id:
+                        self.last_update_id = update.update_id
+                    
+                    if update.message and update.message.text == '/text':
+                        self._dispatch(update)
+                
+                failures = 0
+            except Exception as e:
+                # Any error would otherwise end the task silently; cancellation
+                # is not an Exception and still stops the loop
+                delay = min(self.MAX_BACKOFF, 2 ** failures)
+                failures += 1
+                logger.error(f"Error polling Telegram updates: {e}. Retrying in {delay} seconds...")
+                await asyncio.sleep(delay)
+    
+    def _dispatch(self, update) -> None:
+        """Queue an update for its chat's worker, starting the worker if needed."""
+        chat_id = update.message.chat_id
+        queue = self._chat_queues.setdefault(chat_id, asyncio.Queue())
+        
+        if chat_id not in self._chat_workers:
+            self._chat_workers[chat_id] = asyncio.create_task(self._chat_worker(chat_id, queue))
+        
+        queue.put_nowait(update)
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue) -> None:
+        """Handle the updates of a single chat in arrival order."""
+        while True:
+            update = await queue.get()
+            try:
+                await self._handle_text_command(update.message)
+            except Exception as e:
+                logger.error(f"Error handling update for chat {chat_id}: {e}")
+            finally:
+                queue.task_done()
     
     async def _handle_text_command(self, message) -> None:
         """Send the predefined text message in response to a /text command."""
@@ -195,21 +313,19 @@ class TelegramBotService:
             logger.error(f"Error sending predefined text: {e}")
             
             # Fallback to direct API
-            self._send_text_fallback(message.chat_id, config.PREDEFINED_TEXT)
+            await self._send_text_fallback(message.chat_id)
     
-    def _send_text_fallback(self, chat_id, text) -> bool:
-        """Send text using direct HTTP API as fallback."""
+    async def _send_text_fallback(self, chat_id) -> bool:
+        """Send the predefined text using direct HTTP API as fallback."""
+        if not self._http:
+            return False
+        
         try:
-            response = requests.post(
-                f"https://api.telegram.org/bot{self.bot_token}/sendMessage",
-                json={
-                    "chat_id": chat_id,
-                    "text": text,
-                    "parse_mode": "HTML"
-                },
-                timeout=10
-            )
-            response.raise_for_status()
+            async with self._http.post(
+                self._send_url,
+                json={**self._text_payload, "chat_id": chat_id}
+            ) as response:
+                response.raise_for_status()
             return True
         except Exception as e:
             logger.error(f"Error in fallback text sending: {e}")
@@ -1,11 +1,14 @@
 """Scraper module for apartment listing retrieval."""
 import asyncio
+import json
 import os
-import re
 import tempfile
 import shutil
-import time
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Any, TypeVar
+import aiohttp
+from yarl import URL
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -14,17 +17,89 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
-    StaleElementReferenceException
+    WebDriverException
 )
 
 from config import config
-from utils import retry
+from utils import retry, AsyncRateLimiter
+
+BASE_URL = "https://www.kleinanzeigen.de"
+
+T = TypeVar('T')
+
+
+class _NumberTable(dict):
+    """str.translate table that drops every character it has no entry for."""
+    
+    def __missing__(self, key):
+        return None
+
+
+# Keeps digits and '.', turns the German decimal ',' into '.', drops the rest
+_NUMBER_TABLE = _NumberTable({ord(c): c for c in '0123456789.'})
+_NUMBER_TABLE[ord(',')] = '.'
+
+
+def _parse_number(text: str) -> float:
+    """Parse a number from field text such as '950 €', '75,5 m²' or '3 Zi.'."""
+    return float(text.translate(_NUMBER_TABLE))
+
+
+def _is_consent_cookie(name: str) -> bool:
+    """Tell whether a cookie records the GDPR consent decision."""
+    return 'consent' in name.lower() or name.startswith('gdpr')
+
+
+def _load_consent_cookies() -> List[Dict[str, Any]]:
+    """Read the persisted consent cookies, or an empty list if there are none."""
+    try:
+        with open(config.CONSENT_COOKIE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def _save_consent_cookies(cookies: List[Dict[str, Any]]) -> None:
+    """Persist the consent cookies so later runs can skip the banner."""
+    try:
+        config.CONSENT_COOKIE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(config.CONSENT_COOKIE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f)
+    except OSError as e:
+        print(f"Warning: Failed to save consent cookies: {e}")
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create a keep-alive HTTP session for the listing site.
+    Meant to outlive single search cycles so connections and TLS sessions are reused.
+    """
+    return aiohttp.ClientSession(
+        headers={
+            'User-Agent': config.USER_AGENT,
+            'Accept-Language': 'de-DE,de;q=0.9'
+        },
+        timeout=aiohttp.ClientTimeout(total=config.PAGE_LOAD_TIMEOUT),
+        connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=60)
+    )
 
 
 class WebDriverFactory:
     """Factory class for creating WebDriver instances."""
     
+    # Only text is read from the pages, so images, fonts and trackers are
+    # never loaded. Stylesheets stay enabled: the consent banner waits
+    # rely on computed visibility.
+    BLOCKED_URLS = [
+        "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+        "*.woff", "*.woff2", "*.ttf",
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*"
+    ]
+    CONTENT_PREFS = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    }
+    
     @staticmethod
     def create_chrome_driver() -> webdriver.Chrome:
         """Create and configure a Chrome WebDriver instance."""
@@ -37,6 +112,8 @@ class WebDriverFactory:
         options.add_argument('--disable-gpu')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option("prefs", WebDriverFactory.CONTENT_PREFS)
         
         # Create a unique user data directory to avoid conflicts
         temp_dir = tempfile.mkdtemp(prefix="chromium_user_data_")
@@ -56,70 +133,289 @@ class WebDriverFactory:
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
         
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": WebDriverFactory.BLOCKED_URLS})
+        
         # Store the temp directory for later cleanup
         driver.temp_dir = temp_dir
         
         return driver
 
 
-class ApartmentScraper:
-    """Scraper for apartment listings."""
+class BrowserPool:
+    """
+    Keeps one Chrome WebDriver alive across search cycles.
     
-    def __init__(self):
-        """Initialize the scraper with a WebDriver instance."""
-        self.driver = WebDriverFactory.create_chrome_driver()
-        self.temp_dir = getattr(self.driver, 'temp_dir', None)
+    Browser start-up is paid once per process instead of once per cycle.
+    The driver is health-checked on every checkout and recycled after
+    MAX_USES checkouts to bound leaks in long-running browsers.
+    """
     
-    def __enter__(self):
-        """Context manager entry."""
-        return self
+    MAX_USES = 50
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit with driver cleanup."""
-        if self.driver:
-            self.driver.quit()
+    def __init__(self):
+        """Initialize an empty pool; the browser starts on first checkout."""
+        self._driver: Optional[webdriver.Chrome] = None
+        self._uses = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> webdriver.Chrome:
+        """Return the shared driver, starting or replacing it when needed."""
+        with self._lock:
+            if self._driver is not None and (self._uses >= self.MAX_USES or not self._is_healthy()):
+                print("Recycling shared Chrome instance")
+                self._quit()
+            
+            if self._driver is None:
+                self._driver = WebDriverFactory.create_chrome_driver()
+                self._uses = 0
             
+            self._uses += 1
+            return self._driver
+    
+    def _is_healthy(self) -> bool:
+        """Check that the browser still answers commands."""
+        try:
+            return self._driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+    
+    def _quit(self) -> None:
+        """Quit the driver and remove its profile directory."""
+        temp_dir = getattr(self._driver, 'temp_dir', None)
+        try:
+            self._driver.quit()
+        except WebDriverException as e:
+            print(f"Warning: Failed to quit Chrome cleanly: {e}")
+        self._driver = None
+        
         # Clean up the temporary directory
-        if self.temp_dir and os.path.exists(self.temp_dir):
+        if temp_dir and os.path.exists(temp_dir):
             try:
-                shutil.rmtree(self.temp_dir)
-                print(f"Removed temporary Chrome user data directory: {self.temp_dir}")
+                shutil.rmtree(temp_dir)
+                print(f"Removed temporary Chrome user data directory: {temp_dir}")
             except Exception as e:
-                print(f"Warning: Failed to remove temporary directory {self.temp_dir}: {e}")
+                print(f"Warning: Failed to remove temporary directory {temp_dir}: {e}")
+    
+    def close(self) -> None:
+        """Shut down the shared browser if it is running."""
+        with self._lock:
+            if self._driver is not None:
+                self._quit()
+
+
+# Shared by all scraper instances in the process
+browser_pool = BrowserPool()
+
+
+class ApartmentScraper:
+    """
+    Scraper for apartment listings.
+    
+    Search result pages are server-rendered, so they are fetched over plain
+    HTTP and parsed in-process. When a page actually needs a browser, the
+    long-lived Chrome instance from the browser pool is used.
+    """
+    
+    # Selectors shared by the HTTP and browser paths; listing fields are
+    # looked up relative to their article element
+    _SEL_NO_RESULTS = "span.breadcrump-summary"
+    _SEL_RESULTS = "#srchrslt-adtable"
+    _SEL_ARTICLE = "article.aditem"
+    _SEL_TITLE = "a.ellipsis"
+    _SEL_PRICE = "p.aditem-main--middle--price-shipping--price"
+    _SEL_TAGS = "span.simpletag"
+    _SEL_LOCATION = "div.aditem-main--top--left"
+    _SEL_DESCRIPTION = "p.aditem-main--middle--description"
+    
+    _BROWSER_SELECTORS = {
+        'results': _SEL_RESULTS, 'article': _SEL_ARTICLE, 'title': _SEL_TITLE,
+        'price': _SEL_PRICE, 'tags': _SEL_TAGS, 'location': _SEL_LOCATION,
+        'description': _SEL_DESCRIPTION
+    }
+    
+    # Returns the fields of every listing article in a single round-trip
+    _EXTRACT_LISTINGS_JS = """
+        const sel = arguments[0];
+        const container = document.querySelector(sel.results);
+        if (!container) return [];
+        const text = (a, s) => { const e = a.querySelector(s); return e ? e.innerText.trim() : null; };
+        return Array.from(container.querySelectorAll(sel.article), a => ({
+            id: a.dataset.adid || null,
+            href: a.dataset.href || null,
+            title: text(a, sel.title),
+            price: text(a, sel.price),
+            location: text(a, sel.location),
+            description: text(a, sel.description),
+            tags: Array.from(a.querySelectorAll(sel.tags), t => t.innerText.trim())
+        }));
+    """
+    
+    _DESCRIPTION_JS = """
+        const e = document.getElementById('viewad-description-text');
+        return e ? e.innerText.trim() : null;
+    """
+    
+    def __init__(self, http: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the scraper; the WebDriver is checked out on first use.
+        
+        Args:
+            http: Shared HTTP session to use; a private one is opened if omitted
+        """
+        self._driver = None
+        self._http = http
+        self._owns_http = http is None
+        # Serializes use of the single WebDriver from worker threads
+        self._browser_lock = asyncio.Lock()
+        # Paces requests to the listing site across all concurrent callers
+        self._limiter = AsyncRateLimiter(config.MAX_RPS, 1.0)
+        # Consent from an earlier run, injected instead of clicking the banner again
+        self._consent_cookies = _load_consent_cookies()
+    
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """Lazily check out the shared WebDriver, accepting consent once per browser."""
+        if self._driver is None:
+            self._driver = browser_pool.acquire()
+            if not getattr(self._driver, 'consent_accepted', False):
+                if self._consent_cookies:
+                    self._inject_consent_cookies()
+                else:
+                    self._driver.get(BASE_URL)
+                    self._accept_consent()
+                self._driver.consent_accepted = True
+        return self._driver
+    
+    def _inject_consent_cookies(self) -> None:
+        """Set the stored consent cookies in the browser without navigating."""
+        cookies = []
+        for cookie in self._consent_cookies:
+            param = {k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+                     if k in cookie}
+            if 'expiry' in cookie:
+                param['expires'] = cookie['expiry']
+            cookies.append(param)
+        self._driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+    
+    def _apply_consent_cookies(self) -> None:
+        """Send the stored consent cookies with plain HTTP requests as well."""
+        if self._http and self._consent_cookies:
+            self._http.cookie_jar.update_cookies(
+                {c['name']: c['value'] for c in self._consent_cookies},
+                response_url=URL(BASE_URL)
+            )
+    
+    def _accept_consent(self) -> None:
+        """Click the consent banner and persist the resulting consent cookies."""
+        if self.handle_consent_banner():
+            self._consent_cookies = [c for c in self._driver.get_cookies() if _is_consent_cookie(c['name'])]
+            _save_consent_cookies(self._consent_cookies)
+    
+    def _dismiss_stale_consent(self) -> None:
+        """Accept the banner again if the stored consent was no longer honoured."""
+        if self.driver.find_elements(By.ID, "gdpr-banner-accept"):
+            print("Stored consent expired, accepting banner again")
+            self._accept_consent()
     
-    def handle_consent_banner(self) -> None:
-        """Handle the GDPR consent banner if it appears."""
+    async def __aenter__(self):
+        """Async context manager entry; opens the HTTP session unless one was passed in."""
+        if self._owns_http:
+            self._http = create_http_session()
+        self._apply_consent_cookies()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; shared HTTP session and browser are left running."""
+        if self._owns_http and self._http:
+            await self._http.close()
+            self._http = None
+        self._driver = None
+    
+    async def _fetch(self, url: str) -> str:
+        """Fetch a page over HTTP, respecting the request rate limit."""
+        async with self._limiter:
+            async with self._http.get(url) as response:
+                response.raise_for_status()
+                return await response.text()
+    
+    async def _browse(self, func: Callable[[str], T], url: str) -> T:
+        """
+        Run a browser-based fetch in a worker thread.
+        Navigations draw from the same rate limit as plain HTTP requests.
+        """
+        async with self._browser_lock:
+            async with self._limiter:
+                result = await asyncio.to_thread(func, url)
+        # Consent may have been accepted in the browser; share it with the HTTP session
+        self._apply_consent_cookies()
+        return result
+    
+    def handle_consent_banner(self) -> bool:
+        """Handle the GDPR consent banner if it appears. Returns True if it was accepted."""
         try:
             accept_button = WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
                 EC.element_to_be_clickable((By.ID, "gdpr-banner-accept"))
             )
-            print("Accepting consent banner...")
-            accept_button.click()
-            time.sleep(1)  # Wait for banner to disappear
         except TimeoutException:
             print("No consent banner found or already accepted")
+            return False
+        
+        print("Accepting consent banner...")
+        accept_button.click()
+        try:
+            WebDriverWait(self.driver, 2).until(
+                EC.invisibility_of_element_located((By.ID, "gdpr-banner-accept"))
+            )
+        except TimeoutException:
+            # The click went through; the banner is just slow to disappear
+            print("Consent banner still visible after accepting")
+        return True
     
     @retry(max_retries=3, delay=2)
-    def get_full_listing_description(self, url: str) -> Optional[str]:
-        """Get the full description from the listing page."""
+    async def get_full_listing_description(self, url: str) -> Optional[str]:
+        """
+        Get the full description from the listing page.
+        The description is part of the server-rendered HTML, so no browser
+        is needed unless the page is hidden behind the consent wall.
+        """
+        print(f"Fetching description...")
+        
+        tree = LexborHTMLParser(await self._fetch(url))
+        
+        description_elem = tree.css_first("#viewad-description-text")
+        if description_elem is None:
+            if tree.css_first("#gdpr-banner-accept") is not None:
+                print("Consent wall on listing page, falling back to browser")
+                return await self._browse(self._get_full_listing_description_browser, url)
+            print("No description found")
+            return None
+        
+        # Text nodes are joined with newlines so <br> breaks survive, matching innerText
+        description = description_elem.text(separator='\n', strip=True)
+        if description:
+            print("Successfully fetched description")
+            return description
+        
+        return None
+    
+    def _get_full_listing_description_browser(self, url: str) -> Optional[str]:
+        """
+        Browser-based variant of get_full_listing_description.
+        Only used when the plain HTTP response is blocked by the consent wall.
+        """
         try:
-            print(f"Fetching description...")
-            
-            # Load the page
+            # driver.get returns once the document has loaded
             self.driver.get(url)
-            time.sleep(2)  # Wait for initial load
+            self._dismiss_stale_consent()
             
             # Wait for description container
-            description_container = WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
+            WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located((By.ID, "viewad-description"))
             )
             
-            # Wait a bit more for content to load
-            time.sleep(1)
-            
-            # Get description text
-            description_elem = description_container.find_element(By.ID, "viewad-description-text")
-            description = description_elem.text.strip()
+            # Read the text in the page itself instead of via element round-trips
+            description = self.driver.execute_script(self._DESCRIPTION_JS)
             
             if description:
                 print("Successfully fetched description")
@@ -128,19 +424,109 @@ class ApartmentScraper:
         except TimeoutException:
             print("Timeout while fetching description")
             raise
-        except StaleElementReferenceException:
-            print("Stale element encountered")
-            raise
         except Exception as e:
             print(f"Error fetching description: {str(e)}")
             raise
         
         return None
     
-    def check_search_results(self, url: str) -> List[Dict[str, Any]]:
+    async def check_search_results(self, url: str) -> List[Dict[str, Any]]:
         """
         Check search results for a specific district and return basic listing data.
         This method only collects the data visible on the search results page.
+        HTTP errors are raised so the caller can retry the district.
+        """
+        print(f"\n{'='*50}\n")
+        print(f"Accessing URL: {url}")
+        
+        district = url.split("/")[4].upper()
+        print(f"Checking: {district}")
+        
+        tree = LexborHTMLParser(await self._fetch(url))
+        
+        # First check if there are no results
+        no_results = tree.css_first(self._SEL_NO_RESULTS)
+        if no_results and "keine Ergebnisse" in no_results.text():
+            print(f"No listings found in {district}")
+            return []
+        
+        results_container = tree.css_first(self._SEL_RESULTS)
+        if results_container is None:
+            if tree.css_first("#gdpr-banner-accept") is not None:
+                # Results are hidden behind the consent wall; use the browser
+                print(f"Consent wall in {district}, falling back to browser")
+                return await self._browse(self._check_search_results_browser, url)
+            print(f"No results container found in {district}")
+            return []
+        
+        # Get all valid listing articles
+        listing_articles = results_container.css(self._SEL_ARTICLE)
+        if not listing_articles:
+            print(f"No listings found in {district}")
+            return []
+            
+        print(f"Found {len(listing_articles)} listings to check")
+        
+        # Collect all listing data
+        rows = (self._row(article) for article in listing_articles)
+        listings_data = [row for row in rows if row is not None]
+        print(f"Collected data for {len(listings_data)} listings")
+        
+        print(f"\n{'='*50}\n")
+        return listings_data
+    
+    def _row(self, article) -> Optional[Dict[str, Any]]:
+        """
+        Build the basic listing data for one parsed result article.
+        Returns None for articles that are not complete listings.
+        """
+        attributes = article.attributes
+        listing_id = attributes.get("data-adid")
+        listing_path = attributes.get("data-href")
+        if not listing_id or not listing_path:
+            return None
+        
+        title_elem = article.css_first(self._SEL_TITLE)
+        price_elem = article.css_first(self._SEL_PRICE)
+        location_elem = article.css_first(self._SEL_LOCATION)
+        if title_elem is None or price_elem is None or location_elem is None:
+            print(f"Warning: Could not extract some basic info for listing {listing_id}")
+            return None
+        
+        size = rooms = None
+        try:
+            price = _parse_number(price_elem.text())
+            
+            # Size and rooms from simpletags
+            for tag in article.css(self._SEL_TAGS):
+                text = tag.text(strip=True)
+                if 'm²' in text:
+                    size = _parse_number(text)
+                elif 'Zi.' in text:
+                    # Remove any trailing periods before parsing the room number
+                    rooms = _parse_number(text.rstrip('.'))
+        except ValueError as e:
+            print(f"Error collecting listing data for {listing_id}: {str(e)}")
+            return None
+        
+        desc_elem = article.css_first(self._SEL_DESCRIPTION)
+        
+        return {
+            'listing_id': listing_id,
+            'url': f"{BASE_URL}{listing_path}",
+            'title': title_elem.text(strip=True),
+            'price': price,
+            'size': size,
+            'rooms': rooms,
+            # Collapse the markup's newlines and indentation, as innerText does in the browser path
+            'location': ' '.join(location_elem.text(separator=' ').split()),
+            'description': desc_elem.text(separator='\n', strip=True) if desc_elem is not None else ''
+        }
+    
+    def _check_search_results_browser(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Browser-based variant of check_search_results.
+        Only used when the plain HTTP response is blocked by the consent wall.
         """
         listings_data = []
         
@@ -148,34 +534,31 @@ class ApartmentScraper:
             print(f"\n{'='*50}\n")
             print(f"Accessing URL: {url}")
             
+            # driver.get returns once the document has loaded
             self.driver.get(url)
-            time.sleep(2)  # Short wait for initial load
+            self._dismiss_stale_consent()
             
             district = url.split("/")[4].upper()
             print(f"Checking: {district}")
             
-            # First check if there are no results
-            try:
-                no_results = WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "span.breadcrump-summary"))
-                )
+            # First check if there are no results; the page has loaded, so no wait is needed
+            for no_results in self.driver.find_elements(By.CSS_SELECTOR, self._SEL_NO_RESULTS):
                 if "keine Ergebnisse" in no_results.text:
                     print(f"No listings found in {district}")
                     return []
-            except TimeoutException:
-                pass  # Continue with normal processing if no "no results" message found
             
             # Wait for the search results container
             try:
-                results_container = WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
-                    EC.presence_of_element_located((By.ID, "srchrslt-adtable"))
+                WebDriverWait(self.driver, config.ELEMENT_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self._SEL_RESULTS))
                 )
             except TimeoutException:
                 print(f"No results container found in {district}")
                 return []
             
-            # Get all valid listing articles
-            listing_articles = results_container.find_elements(By.CSS_SELECTOR, "article.aditem")
+            # Read all listing fields in one command; no element references
+            # are handed back, so nothing can go stale while iterating
+            listing_articles = self.driver.execute_script(self._EXTRACT_LISTINGS_JS, self._BROWSER_SELECTORS)
             if not listing_articles:
                 print(f"No listings found in {district}")
                 return []
@@ -185,80 +568,36 @@ class ApartmentScraper:
             # Collect all listing data
             for article in listing_articles:
                 try:
-                    # Get listing ID
-                    listing_id = article.get_attribute("data-adid")
-                    if not listing_id:
+                    listing_id = article['id']
+                    listing_path = article['href']
+                    if not listing_id or not listing_path:
                         continue
                     
-                    # Get listing URL
-                    listing_path = article.get_attribute("data-href")
-                    if not listing_path:
+                    if article['title'] is None or article['price'] is None or article['location'] is None:
+                        print(f"Warning: Could not extract some basic info for listing {listing_id}")
                         continue
                     
-                    listing_url = f"https://www.kleinanzeigen.de{listing_path}"
-                    
-                    # Extract all basic info
                     basic_info = {
                         'listing_id': listing_id,
-                        'url': listing_url,
-                        'title': '',
-                        'price': None,
+                        'url': f"{BASE_URL}{listing_path}",
+                        'title': article['title'],
+                        'price': _parse_number(article['price']),
                         'size': None,
                         'rooms': None,
-                        'location': '',
-                        'description': ''
+                        'location': article['location'],
+                        'description': article['description'] or ''
                     }
                     
-                    # Use WebDriverWait for each element to handle stale elements
-                    wait = WebDriverWait(self.driver, 5)
+                    # Size and rooms from simpletags
+                    for text in article['tags']:
+                        if 'm²' in text:
+                            basic_info['size'] = _parse_number(text)
+                        elif 'Zi.' in text:
+                            # Clean up the room number text and remove any trailing periods
+                            basic_info['rooms'] = _parse_number(text.rstrip('.'))
                     
-                    try:
-                        # Title
-                        title_elem = wait.until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, f"article[data-adid='{listing_id}'] a.ellipsis"))
-                        )
-                        basic_info['title'] = title_elem.text.strip()
-                        
-                        # Price
-                        price_elem = wait.until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, f"article[data-adid='{listing_id}'] p.aditem-main--middle--price-shipping--price"))
-                        )
-                        price_text = price_elem.text.strip()
-                        basic_info['price'] = float(re.sub(r'[^\d.,]', '', price_text).replace(',', '.'))
-                        
-                        # Size and rooms from simpletags
-                        simpletags = article.find_elements(By.CSS_SELECTOR, "span.simpletag")
-                        for tag in simpletags:
-                            text = tag.text.strip()
-                            if 'm²' in text:
-                                basic_info['size'] = float(re.sub(r'[^\d.,]', '', text).replace(',', '.'))
-                            elif 'Zi.' in text:
-                                # Clean up the room number text and remove any trailing periods
-                                cleaned_text = text.rstrip('.')  # Remove trailing periods
-                                number_only = re.sub(r'[^\d.,]', '', cleaned_text).replace(',', '.')
-                                basic_info['rooms'] = float(number_only)
-                        
-                        # Location
-                        location_elem = wait.until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, f"article[data-adid='{listing_id}'] div.aditem-main--top--left"))
-                        )
-                        basic_info['location'] = location_elem.text.strip()
-                        
-                        # Preview description
-                        try:
-                            desc_elem = wait.until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, f"article[data-adid='{listing_id}'] p.aditem-main--middle--description"))
-                            )
-                            basic_info['description'] = desc_elem.text.strip()
-                        except (TimeoutException, NoSuchElementException):
-                            pass
-                        
-                        listings_data.append(basic_info)
-                        print(f"Collected data for listing: {listing_id}")
-                        
-                    except (TimeoutException, NoSuchElementException, StaleElementReferenceException) as e:
-                        print(f"Warning: Could not extract some basic info for listing {listing_id}: {str(e)}")
-                        continue
+                    listings_data.append(basic_info)
+                    print(f"Collected data for listing: {listing_id}")
                     
                 except Exception as e:
                     print(f"Error collecting listing data: {str(e)}")
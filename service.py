@@ -1,15 +1,16 @@
 """Service layer for the apartment search application."""
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any
 import time
 from datetime import datetime
 
+import aiohttp
+
 from config import config
 from database import DatabaseManager, ListingRepository
-from scraper import ApartmentScraper, WebDriverFactory
+from scraper import ApartmentScraper, browser_pool, create_http_session
 from notifier import NotificationService, create_notifier
-# removed analyze_description import as it's no longer used
 
 logger = logging.getLogger(__name__)
 
@@ -18,68 +19,138 @@ class ApartmentService:
     
     def __init__(self, 
                  db_repo: ListingRepository,
-                 notifier: Optional[NotificationService] = None):
+                 notifier: Optional[NotificationService] = None,
+                 http_session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the apartment service.
         
         Args:
             db_repo: Repository for database operations
             notifier: Optional notification service
+            http_session: Optional HTTP session shared by all search cycles
         """
         self.db_repo = db_repo
         self.notifier = notifier
-        self.processed_ids: Set[str] = set()
+        self.http_session = http_session
     
-    async def process_listing(self, basic_info: Dict[str, Any], scraper: ApartmentScraper) -> bool:
+    async def prepare_listing(self, basic_info: Dict[str, Any], scraper: ApartmentScraper) -> Dict[str, Any]:
         """
-        Process a single apartment listing by fetching full details,
-        saving to database, and sending notifications.
+        Prepare a single new apartment listing for saving by fetching full details.
         
         Args:
             basic_info: Basic listing information from search results
             scraper: Scraper instance to fetch additional details
         
         Returns:
-            True if listing was processed successfully
+            The completed listing
         """
         listing_id = basic_info['listing_id']
+        logger.info(f"Processing listing: {listing_id} - {basic_info.get('title', '')}")
         
-        if listing_id in self.processed_ids or self.db_repo.listing_exists(listing_id):
-            logger.debug(f"Listing {listing_id} already processed, skipping")
-            return False
+        # Get full description if available
+        full_description = await scraper.get_full_listing_description(basic_info['url'])
+        if full_description:
+            basic_info['description'] = full_description
+        
+        # Set all listings as suitable since we're not filtering
+        basic_info['status'] = 'suitable'
+        
+        return basic_info
+    
+    async def process_listing(self, listing: Dict[str, Any]) -> bool:
+        """
+        Send the notification for a saved listing and mark it as processed.
+        
+        Args:
+            listing: Listing that has already been saved to the database
+        
+        Returns:
+            True if listing was processed successfully
+        """
+        listing_id = listing['listing_id']
         
         try:
-            logger.info(f"Processing listing: {listing_id} - {basic_info.get('title', '')}")
-            
-            # Get full description if available
-            full_description = scraper.get_full_listing_description(basic_info['url'])
-            if full_description:
-                basic_info['description'] = full_description
-            
-            # Set all listings as suitable since we're not filtering
-            basic_info['status'] = 'suitable'
-            
-            # Save to database
-            self.db_repo.save_listing(basic_info)
-            logger.info(f"Saved listing {listing_id}")
-            
             # Send notification for all listings
             if self.notifier:
-                await self.notifier.send_listing_notification(basic_info)
+                await self.notifier.send_listing_notification(listing)
                 logger.info(f"Notification sent for listing: {listing_id}")
             
             # Mark as processed
-            self.db_repo.mark_listing_processed(listing_id)
-            self.processed_ids.add(listing_id)
+            await self.db_repo.amark_listing_processed(listing_id)
             
             return True
             
         except Exception as e:
             logger.error(f"Error processing listing {listing_id}: {str(e)}")
-            if basic_info.get('listing_id'):
-                self.db_repo.mark_listing_error(listing_id, str(e))
+            await self.db_repo.amark_listing_error(listing_id, str(e))
             return False
     
+    async def _flush_listings(self, pending: Dict[str, Dict[str, Any]], stats: Dict[str, int]) -> None:
+        """Save all listings collected in a search pass at once, then notify."""
+        if not pending:
+            return
+        
+        listings = list(pending.values())
+        
+        try:
+            inserted = await self.db_repo.asave_listings(listings)
+        except Exception as e:
+            logger.error(f"Error saving {len(listings)} listings as a batch, saving one by one: {str(e)}")
+            inserted = await self._save_individually(listings, stats)
+        logger.info(f"Saved {len(inserted)} new listings")
+        
+        # Only rows this pass actually inserted are notified
+        for listing_id in inserted:
+            if await self.process_listing(pending[listing_id]):
+                stats['processed'] += 1
+            else:
+                stats['errors'] += 1
+    
+    async def _save_individually(self, listings: List[Dict[str, Any]], stats: Dict[str, int]) -> List[str]:
+        """
+        Save listings one at a time so a single bad row can't block the rest.
+        Returns the listing IDs that were inserted.
+        """
+        inserted = []
+        for listing in listings:
+            try:
+                if await self.db_repo.asave_listing(listing) is not None:
+                    inserted.append(listing['listing_id'])
+            except Exception as e:
+                logger.error(f"Error saving listing {listing['listing_id']}: {str(e)}")
+                stats['errors'] += 1
+        return inserted
+    
+    async def _scan_district(self, url: str, scraper: ApartmentScraper,
+                             sem: asyncio.Semaphore, stats: Dict[str, int]) -> List[Dict[str, Any]]:
+        """
+        Scan one district's search results and return the listings found.
+        Failures are retried per district so they don't affect the others.
+        """
+        max_retries = 3
+        
+        for attempt in range(1, max_retries + 1):
+            try:
+                async with sem:
+                    # Get basic listings data from search results
+                    listings_data = await scraper.check_search_results(url)
+                break
+            except Exception as e:
+                logger.error(f"Error checking search URL {url} (attempt {attempt}/{max_retries}): {str(e)}")
+                if attempt == max_retries:
+                    stats['errors'] += 1
+                    return []
+                await asyncio.sleep(10)
+        
+        stats['total_found'] += len(listings_data)
+        return listings_data
+    
+    async def _prepare_bounded(self, basic_info: Dict[str, Any], scraper: ApartmentScraper,
+                               sem: asyncio.Semaphore) -> Dict[str, Any]:
+        """Prepare a listing while holding a slot of the detail fetch semaphore."""
+        async with sem:
+            return await self.prepare_listing(basic_info, scraper)
+    
     async def search_apartments(self) -> Dict[str, int]:
         """
         Perform a complete apartment search cycle.
@@ -96,58 +167,49 @@ class ApartmentService:
         start_time = time.time()
         logger.info("Starting new search cycle...")
         
-        # Add retry logic for scraper initialization
-        max_scraper_retries = 3
-        scraper_retry_count = 0
+        # New listings are collected over the whole pass and saved in one batch
+        pending: Dict[str, Dict[str, Any]] = {}
         
-        while scraper_retry_count < max_scraper_retries:
-            try:
-                with ApartmentScraper() as scraper:
-                    try:
-                        # Initialize the scraper with consent acceptance
-                        scraper.driver.get("https://www.kleinanzeigen.de")
-                        scraper.handle_consent_banner()
-                    except Exception as e:
-                        logger.error(f"Failed to initialize scraper: {e}")
-                        raise
-                    
-                    # Process each search URL (district)
-                    for url in config.SEARCH_URLS:
-                        try:
-                            # Get basic listings data from search results
-                            listings_data = scraper.check_search_results(url)
-                            stats['total_found'] += len(listings_data)
-                            
-                            # Process each listing
-                            for basic_info in listings_data:
-                                try:
-                                    await self.process_listing(basic_info, scraper)
-                                    stats['processed'] += 1
-                                except Exception as e:
-                                    logger.error(f"Error processing individual listing: {str(e)}")
-                                    stats['errors'] += 1
-                                
-                                # Brief pause between listings
-                                await asyncio.sleep(1)
-                            
-                        except Exception as e:
-                            logger.error(f"Error checking search URL {url}: {str(e)}")
-                            stats['errors'] += 1
-                        
-                        # Pause between districts to avoid rate limiting
-                        await asyncio.sleep(2)
-                
-                # If we got here without exception, break out of the retry loop
-                break
-                
-            except Exception as e:
-                scraper_retry_count += 1
-                logger.error(f"Scraper failed (attempt {scraper_retry_count}/{max_scraper_retries}): {e}")
-                if scraper_retry_count >= max_scraper_retries:
-                    logger.error("Maximum scraper retry attempts reached, giving up")
+        async with ApartmentScraper(self.http_session) as scraper:
+            # Districts are independent, so scan them concurrently
+            sem = asyncio.Semaphore(config.MAX_CONCURRENCY)
+            results = await asyncio.gather(
+                *(self._scan_district(url, scraper, sem, stats) for url in config.SEARCH_URLS),
+                return_exceptions=True
+            )
+            
+            # Districts overlap, so keep only the first occurrence of each listing
+            candidates: Dict[str, Dict[str, Any]] = {}
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"District scan failed: {result}")
+                    stats['errors'] += 1
+                    continue
+                for basic_info in result:
+                    candidates.setdefault(basic_info['listing_id'], basic_info)
+            
+            # One query tells which candidates are already stored; recently
+            # seen IDs are answered from the repository's bounded cache
+            known = await self.db_repo.aexisting_ids(list(candidates))
+            for listing_id in known:
+                del candidates[listing_id]
+            logger.debug(f"Skipping {len(known)} already processed listings")
+            
+            # Fetch the detail pages of all candidates concurrently
+            detail_sem = asyncio.Semaphore(config.DETAIL_CONCURRENCY)
+            prepared = await asyncio.gather(
+                *(self._prepare_bounded(basic_info, scraper, detail_sem)
+                  for basic_info in candidates.values()),
+                return_exceptions=True
+            )
+            for listing in prepared:
+                if isinstance(listing, Exception):
+                    logger.error(f"Error processing individual listing: {str(listing)}")
+                    stats['errors'] += 1
                 else:
-                    logger.info(f"Retrying with a new scraper instance in 10 seconds...")
-                    await asyncio.sleep(10)
+                    pending[listing['listing_id']] = listing
+        
+        await self._flush_listings(pending, stats)
         
         # Log statistics
         duration = time.time() - start_time
@@ -181,6 +243,9 @@ class ApartmentSearchRunner:
         # Control flags
         self.is_running = False
         self.search_task = None
+        
+        # Current wait between cycles, adapted to how active the listings are
+        self._backoff = config.CHECK_INTERVAL
     
     async def start(self) -> None:
         """Start the apartment search service."""
@@ -191,6 +256,9 @@ class ApartmentSearchRunner:
         self.is_running = True
         logger.info("Starting apartment search service")
         
+        # One HTTP session for all cycles keeps connections to the site alive
+        self.apartment_service.http_session = create_http_session()
+        
         # Start the continuous search loop
         self.search_task = asyncio.create_task(self._search_loop())
     
@@ -211,6 +279,13 @@ class ApartmentSearchRunner:
                 pass
         
         # Clean up
+        if self.apartment_service.http_session:
+            await self.apartment_service.http_session.close()
+            self.apartment_service.http_session = None
+        await asyncio.to_thread(browser_pool.close)
+        if self.notifier:
+            await self.notifier.close()
+        await asyncio.to_thread(self.listing_repo.close)
         self.db_manager.close()
         logger.info("Apartment search service stopped")
     
@@ -223,6 +298,7 @@ class ApartmentSearchRunner:
             try:
                 # Attempt a search cycle
                 stats = await self.apartment_service.search_apartments()
+                self._adjust_backoff(stats['processed'])
                 
                 # Reset failure counter on success
                 if consecutive_failures > 0:
@@ -241,6 +317,16 @@ class ApartmentSearchRunner:
                     consecutive_failures = 0  # Reset after the long break
             
             # Normal wait interval between cycles
-            wait_time = config.CHECK_INTERVAL
-            logger.info(f"Waiting {wait_time} seconds until next search cycle...")
+            wait_time = self._backoff
+            logger.info(f"Waiting {wait_time:.0f} seconds until next search cycle...")
             await asyncio.sleep(wait_time)
+    
+    def _adjust_backoff(self, new_listings: int) -> None:
+        """
+        Poll more often right after new listings were found and back off
+        gradually while nothing new shows up.
+        """
+        if new_listings > 0:
+            self._backoff = max(config.CHECK_INTERVAL_MIN, self._backoff / 2)
+        else:
+            self._backoff = min(config.CHECK_INTERVAL_MAX, self._backoff * 1.5)
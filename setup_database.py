@@ -1,8 +1,6 @@
 """Database setup script for apartment search application."""
-import os
 import logging
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from pathlib import Path
 
 from config import config
@@ -14,6 +12,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolved next to this module so setup works from any working directory
+SQL_FILE_PATH = Path(__file__).with_name('create_tables.sql')
+
 def setup_database():
     """Initialize the database with required tables and indexes."""
     logger.info("Setting up database...")
@@ -23,19 +24,20 @@ def setup_database():
         raise ValueError("DATABASE_URL not found in environment variables")
     
     # Validate SQL file exists
-    sql_file_path = Path('create_tables.sql')
-    if not sql_file_path.exists():
-        raise FileNotFoundError(f"SQL file not found: {sql_file_path}")
+    if not SQL_FILE_PATH.exists():
+        raise FileNotFoundError(f"SQL file not found: {SQL_FILE_PATH}")
+    
+    sql_commands = SQL_FILE_PATH.read_text()
     
     try:
-        # Connect to PostgreSQL
         conn = psycopg2.connect(config.DATABASE_URL)
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        cur = conn.cursor()
-        
-        # Read and execute SQL file
-        with open(sql_file_path, 'r') as file:
-            sql_commands = file.read()
+    except psycopg2.Error as e:
+        logger.error(f"Database error: {e}")
+        raise
+    
+    try:
+        # All statements run in one transaction, so a failure leaves no partial schema
+        with conn, conn.cursor() as cur:
             cur.execute(sql_commands)
         
         logger.info("Database setup completed successfully!")
@@ -48,10 +50,7 @@ def setup_database():
         logger.error(f"Unexpected error: {e}")
         raise
     finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
+        conn.close()
 
 if __name__ == "__main__":
     try:
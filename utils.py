@@ -1,8 +1,13 @@
 """Utility functions for the apartment search application."""
+import asyncio
+import random
+import re
+import sys
 import time
 import functools
+import inspect
 import logging
-from typing import TypeVar, Callable, Any, List, Dict, Tuple, Optional
+from typing import TypeVar, Callable, Any, Coroutine, List, Dict, Tuple, Optional
 
 # Set up logging
 logging.basicConfig(
@@ -16,25 +21,66 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 R = TypeVar('R')
 
+_NUMBER_RE = re.compile(r'(\d+[.,]?\d*)')
+
 def retry(max_retries: int = 3, delay: float = 1.0, 
           exception_types: Tuple = (Exception,), 
-          logger_func: Optional[Callable[[str], Any]] = None):
+          logger_func: Optional[Callable[[str], Any]] = None,
+          backoff: str = 'exponential', max_delay: float = 30.0,
+          jitter: float = 1.0):
     """
     Decorator for retrying a function if it raises specified exceptions.
+    Coroutine functions are retried without blocking the event loop.
     
     Args:
         max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Delay before the first retry in seconds
         exception_types: Tuple of exception types to catch and retry
         logger_func: Optional function to log retry attempts
+        backoff: 'exponential' to double the delay after each attempt, 'fixed' to keep it
+        max_delay: Upper bound for a single delay in seconds
+        jitter: Maximum random seconds added to each delay, so that
+            concurrent callers don't retry in lockstep
     
     Returns:
         The decorator function
     """
+    if backoff not in ('exponential', 'fixed'):
+        raise ValueError(f"Unknown backoff strategy: {backoff}")
+    
+    def next_delay(attempt: int) -> float:
+        base = delay * 2 ** attempt if backoff == 'exponential' else delay
+        return min(max_delay, base + random.uniform(0, jitter))
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        log = logger_func or logger.warning
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                last_exception = None
+                
+                for attempt in range(max_retries + 1):
+                    try:
+                        if attempt > 0:
+                            log(f"Retry attempt {attempt}/{max_retries} for {func.__name__}")
+                        return await func(*args, **kwargs)
+                    except exception_types as e:
+                        last_exception = e
+                        if attempt < max_retries:
+                            wait = next_delay(attempt)
+                            log(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {wait:.1f} seconds...")
+                            await asyncio.sleep(wait)
+                        else:
+                            log(f"All {max_retries} retries failed for {func.__name__}")
+                
+                # If we reach here, all retries have failed
+                raise last_exception
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            log = logger_func or logger.warning
             last_exception = None
             
             for attempt in range(max_retries + 1):
@@ -45,8 +91,9 @@ def retry(max_retries: int = 3, delay: float = 1.0,
                 except exception_types as e:
                     last_exception = e
                     if attempt < max_retries:
-                        log(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay} seconds...")
-                        time.sleep(delay)
+                        wait = next_delay(attempt)
+                        log(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {wait:.1f} seconds...")
+                        time.sleep(wait)
                     else:
                         log(f"All {max_retries} retries failed for {func.__name__}")
             
@@ -66,12 +113,11 @@ def extract_number(text: str) -> Optional[float]:
     Returns:
         Float value if found, None otherwise
     """
-    import re
     if not text:
         return None
     
     # Try to extract a numeric value
-    match = re.search(r'(\d+[.,]?\d*)', text)
+    match = _NUMBER_RE.search(text)
     if match:
         return float(match.group(1).replace(',', '.'))
     return None
@@ -86,15 +132,72 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted duration string (e.g., "2h 30m 15s")
     """
-    minutes, seconds = divmod(seconds, 60)
-    hours, minutes = divmod(minutes, 60)
-    
-    parts = []
-    if hours > 0:
-        parts.append(f"{int(hours)}h")
-    if minutes > 0 or (hours > 0 and seconds > 0):
-        parts.append(f"{int(minutes)}m")
-    if seconds > 0 or not parts:
-        parts.append(f"{int(seconds)}s")
-    
-    return " ".join(parts)
\ No newline at end of file
+    total = int(seconds)
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    
+    if hours:
+        return f"{hours}h {minutes}m {secs}s"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how often an async block may be entered.
+    
+    Usage:
+        limiter = AsyncRateLimiter(max_rate=2, time_period=1.0)
+        async with limiter:
+            ...
+    
+    Args:
+        max_rate: Number of entries allowed per time period (also the burst size)
+        time_period: Length of the period in seconds
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._last_refill) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+    
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+def run_event_loop(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    Falls back to the default asyncio event loop if uvloop is unavailable.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+    
+    uvloop.install()
+    return asyncio.run(main)